@@ -1,17 +1,22 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
+import textwrap
+import plotly.graph_objects as go
+import pyarrow as pa
+from types import SimpleNamespace
 from streamlit_option_menu import option_menu  # Import the option menu
-from scipy.stats import pearsonr  # For calculating correlation
 
 # Set the title and description, and collapse the sidebar initially
 st.set_page_config(page_title="Video Game Sales", layout="wide", initial_sidebar_state="collapsed")
 
-# Load the dataset
-@st.cache_data
-def load_data():
-    data = pd.read_csv("videogamesales.csv")
+# Load the dataset from its Parquet copy, which already stores the compact dtypes
+# (videogamesales.csv is the source; convert_data.py holds the dtypes and writes the Parquet file from it)
+# The raw frame is one shared object per process (st.cache_data would copy it on every rerun);
+# it is only read, and the pages work from the small cached aggregates below
+@st.cache_resource(show_spinner=False, max_entries=1)  # Read once per process; reruns get the cached frame without a spinner flash
+def load_data(path="videogamesales.parquet"):
+    data = pd.read_parquet(path, engine="pyarrow")
     return data
 
 data = load_data()
@@ -25,6 +30,154 @@ region_mapping = {
     "Other Sales": "Other_Sales"
 }
 
+# Store the sales columns once as a contiguous float32 matrix (one column per region),
+# shared like the raw frame instead of being copied on every rerun
+@st.cache_resource
+def load_sales_soa():
+    return np.ascontiguousarray(data[list(region_mapping.values())].to_numpy(dtype=np.float32))
+
+sales_soa = load_sales_soa()
+
+# Column index of each region in the sales matrix
+region_idx = {name: i for i, name in enumerate(region_mapping)}
+
+# Total sales per value of a grouping column (rows with a missing key are left out)
+# Summed in float64 and rounded to the data's two decimals, so float32 rounding noise
+# cannot turn an unchanged total into a rising or falling one
+def aggregate_sales(group_column, sales_columns):
+    sales = data[list(sales_columns)].astype(np.float64)
+    return sales.groupby(data[group_column], observed=True, sort=True).sum().round(2)
+
+# Yearly sales totals for every region (rows without a release year are left out)
+def year_sums():
+    year_data = aggregate_sales('Year', list(region_mapping.values())).reset_index()
+    return year_data.astype({'Year': int})  # Integer years avoid plotting errors
+
+# Pearson correlation between every pair of regions (5 x 5)
+# (0 for a region without any variation instead of a division by zero)
+def corr_matrix():
+    covariance = np.cov(sales_soa, rowvar=False)
+    std_sales = np.sqrt(np.diag(covariance))
+    scale = np.outer(std_sales, std_sales)
+    correlation = np.divide(covariance, scale, out=np.zeros_like(covariance), where=scale > 0)
+    return np.clip(correlation, -1, 1)
+
+# OLS trendline slope and intercept for every (X region, Y region) pair
+# (a flat trendline when the X region has no variation)
+def trendline_coefficients():
+    covariance = np.cov(sales_soa, rowvar=False)
+    means = sales_soa.mean(axis=0, dtype=np.float64)
+    variances = np.diag(covariance)[:, None]
+    slopes = np.divide(covariance, variances, out=np.zeros_like(covariance), where=variances > 0)  # Row: X region, column: Y region
+    intercepts = means[None, :] - slopes * means[:, None]
+    return slopes, intercepts
+
+# Every aggregation the pages read, computed once per process. st.cache_resource hands back the
+# same object on every rerun (no copy), so the tables must be treated as read-only
+@st.cache_resource
+def precomputed():
+    sales_columns = list(region_mapping.values())
+    slopes, intercepts = trendline_coefficients()
+    # Dense sales array of every region with its missing values removed (only the histograms need them)
+    region_arrays = {
+        column: np.ascontiguousarray(sales_soa[~np.isnan(sales_soa[:, i]), i])
+        for i, column in enumerate(sales_columns)
+    }
+    return SimpleNamespace(
+        by_platform=aggregate_sales('Platform', sales_columns),
+        by_genre=aggregate_sales('Genre', sales_columns),
+        by_year=year_sums(),
+        correlation=corr_matrix(),
+        slopes=slopes,
+        intercepts=intercepts,
+        # Histogram (counts, bin edges) of every sales column, 30 bins each
+        histograms={column: np.histogram(sales, bins=30) for column, sales in region_arrays.items()}
+    )
+
+tables = precomputed()
+
+# Precompute the descriptive statistics of every region once, since the dataset is static
+# (a shared, read-only object like the tables above)
+@st.cache_resource
+def compute_region_stats():
+    # Sales are recorded to two decimals; snap the float32 values back to them so that
+    # values lying exactly on an outlier bound are not misclassified by float32 rounding
+    sales = np.round(sales_soa.astype(np.float64), 2)
+
+    # Sort every column once (missing values go last): min/max and the outlier counts
+    # then become index lookups instead of extra passes over the whole matrix
+    sorted_sales = np.sort(sales, axis=0)
+    n_valid = np.count_nonzero(~np.isnan(sales), axis=0)
+
+    # Every statistic is computed for all regions at once (one value per column)
+    quartiles = np.nanquantile(sorted_sales, [0.25, 0.5, 0.75], axis=0)  # 3 x regions matrix
+    p25, p50, p75 = quartiles
+    iqr = p75 - p25
+    lower_bound = p25 - 1.5 * iqr
+    upper_bound = p75 + 1.5 * iqr
+
+    min_sales = sorted_sales[0]
+    max_sales = sorted_sales[n_valid - 1, np.arange(sales.shape[1])]
+
+    # Variance, standard deviation and skewness all derive from the same deviations from the mean
+    mean_sales = np.nanmean(sales, axis=0)
+    deviations = sales - mean_sales
+    squared_deviations = deviations * deviations
+    m2 = np.nansum(squared_deviations, axis=0)
+    m3 = np.nansum(squared_deviations * deviations, axis=0)
+    var_sales = m2 / (n_valid - 1)
+    std_sales = np.sqrt(var_sales)
+
+    # Sample skewness, bias-corrected like pandas' skew (0 when a region has no spread)
+    skewness = np.divide(
+        np.sqrt(n_valid * (n_valid - 1)) / (n_valid - 2) * (m3 / n_valid),
+        (m2 / n_valid) ** 1.5,
+        out=np.zeros_like(m2),
+        where=m2 > 0
+    )
+
+    # Split the per-region vectors into one dictionary per sales column
+    stats = {}
+    for region, column in region_mapping.items():
+        i = region_idx[region]
+        sales_data = sorted_sales[:n_valid[i], i]
+
+        # Most frequent value (the smallest one on ties)
+        values, counts = np.unique(sales_data, return_counts=True)
+
+        # Count the values below the lower bound and above the upper bound (no values are copied)
+        n_below = np.searchsorted(sales_data, lower_bound[i], side="left")
+        n_above = sales_data.size - np.searchsorted(sales_data, upper_bound[i], side="right")
+        first_above = sales_data.size - n_above
+
+        stats[column] = {
+            "mean": mean_sales[i],
+            "median": p50[i],
+            "mode": values[counts.argmax()],
+            "std": std_sales[i],
+            "var": var_sales[i],
+            "min": min_sales[i],
+            "max": max_sales[i],
+            "quartiles": quartiles[:, i],  # 25th, 50th and 75th percentiles
+            "iqr": iqr[i],
+            "skew": skewness[i],
+            "n_outliers": int(n_below + n_above),
+            # Box plot whiskers: the most extreme values still within the outlier bounds
+            "lower_fence": sales_data[n_below],
+            "upper_fence": sales_data[first_above - 1],
+            # Distinct outlier values, drawn as points beyond the whiskers
+            "outliers": np.unique(np.concatenate([sales_data[:n_below], sales_data[first_above:]]))
+        }
+    return stats
+
+region_stats = compute_region_stats()
+
+# Read the team members image once; the encoded bytes are shared by every rerun and session
+@st.cache_resource
+def load_members_image(image_path):
+    with open(image_path, "rb") as image_file:
+        return image_file.read()
+
 with st.sidebar:
     
     selected = option_menu(
@@ -37,96 +190,117 @@ with st.sidebar:
     )
     st.write("Team Members")
     image_path = "members.png" 
-    st.image(image_path, use_column_width=True)
+    st.image(load_members_image(image_path), use_column_width=True)
    
     
 
 
+# Render a list of (possibly indented) markdown paragraphs as a single markdown element
+def write_paragraphs(paragraphs):
+    st.markdown("\n\n".join(textwrap.dedent(paragraph).strip() for paragraph in paragraphs))
+
+
 # Function to calculate and display metrics with dynamic insights
 def show_metrics(selected_region):
 
-    # Get the relevant sales column based on the selected region
-    sales_data = data[region_mapping[selected_region]]
+    # Look up the precomputed statistics for the selected region
+    stats = region_stats[region_mapping[selected_region]]
     
-    # Calculate the metrics
-    mean_sales = sales_data.mean()
-    median_sales = sales_data.median()
-    mode_sales = sales_data.mode().values[0]  # Most frequent value
-    std_sales = sales_data.std()
-    var_sales = sales_data.var()
-    min_sales = sales_data.min()
-    max_sales = sales_data.max()
+    # Read the metrics
+    mean_sales = stats["mean"]
+    median_sales = stats["median"]
+    mode_sales = stats["mode"]
+    std_sales = stats["std"]
+    var_sales = stats["var"]
+    min_sales = stats["min"]
+    max_sales = stats["max"]
     range_sales = max_sales - min_sales
-    percentiles = np.percentile(sales_data, [25, 50, 75])
+    percentiles = stats["quartiles"]
 
     # Skewness (asymmetry in the data distribution)
-    skewness = sales_data.skew()
+    skewness = stats["skew"]
 
     # Interquartile Range (IQR) to detect potential outliers
-    Q1 = np.percentile(sales_data, 25)
-    Q3 = np.percentile(sales_data, 75)
-    IQR = Q3 - Q1
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
+    IQR = stats["iqr"]
 
-    # Identify potential outliers
-    outliers = sales_data[(sales_data < lower_bound) | (sales_data > upper_bound)]
+    # Number of potential outliers (values outside 1.5 * IQR from the quartiles)
+    n_outliers = stats["n_outliers"]
 
     # Display the metrics using Streamlit's metric component, arranged horizontally
     st.subheader(f"📈 {selected_region} Statistics")
-    
-    # First row
-    col1, col2, col3 = st.columns(3)
-    col1.metric("Mean", f"{mean_sales:.2f} M")
-    col2.metric("Median", f"{median_sales:.2f} M")
-    col3.metric("Mode", f"{mode_sales:.2f} M")
-    
-    # Second row
-    col1, col2, col3 = st.columns(3)
-    col1.metric("Standard Deviation", f"{std_sales:.2f} M")
-    col2.metric("Variance", f"{var_sales:.2f} M")
-    col3.metric("Range", f"{range_sales:.2f} M")
-    
-    # Third row
-    col1, col2, col3 = st.columns(3)
-    col1.metric("Min", f"{min_sales:.2f} M")
-    col2.metric("Max", f"{max_sales:.2f} M")
-    col3.metric("25th Percentile", f"{percentiles[0]:.2f} M")
-    
-    # Fourth row
-    col1, col2, col3 = st.columns(3)
-    col1.metric("50th Percentile (Median)", f"{percentiles[1]:.2f} M")
-    col2.metric("75th Percentile", f"{percentiles[2]:.2f} M")
+
+    # Metrics in reading order, three per row
+    metrics = [
+        ("Mean", mean_sales),
+        ("Median", median_sales),
+        ("Mode", mode_sales),
+        ("Standard Deviation", std_sales),
+        ("Variance", var_sales),
+        ("Range", range_sales),
+        ("Min", min_sales),
+        ("Max", max_sales),
+        ("25th Percentile", percentiles[0]),
+        ("50th Percentile (Median)", percentiles[1]),
+        ("75th Percentile", percentiles[2])
+    ]
+
+    # A single set of three columns; metric i goes to column i % 3 so the grid still reads row by row
+    cols = st.columns(3)
+    for i, (label, value) in enumerate(metrics):
+        cols[i % 3].metric(label, f"{value:.2f} M")
 
     # Dynamic Insights Section
     st.subheader("🔍 Insights")
 
+    insights = []  # Paragraphs collected below and rendered together
+
     # 1. Spread Insights
     if std_sales > 1:
-        st.write(f"The spread of sales in {selected_region} is quite wide with a standard deviation of {std_sales:.2f} million units, indicating significant variability across the data.")
+        insights.append(f"The spread of sales in {selected_region} is quite wide with a standard deviation of {std_sales:.2f} million units, indicating significant variability across the data.")
     else:
-        st.write(f"The sales in {selected_region} are relatively consistent, with a standard deviation of {std_sales:.2f} million units, suggesting limited variation.")
+        insights.append(f"The sales in {selected_region} are relatively consistent, with a standard deviation of {std_sales:.2f} million units, suggesting limited variation.")
 
     # 2. Skewness Insights
     if skewness > 0:
-        st.write(f"The distribution of sales in {selected_region} is positively skewed (skewness: {skewness:.2f}), meaning there are more low sales values and a few high-value outliers.")
+        insights.append(f"The distribution of sales in {selected_region} is positively skewed (skewness: {skewness:.2f}), meaning there are more low sales values and a few high-value outliers.")
     elif skewness < 0:
-        st.write(f"The distribution of sales in {selected_region} is negatively skewed (skewness: {skewness:.2f}), indicating a concentration of higher sales with some lower-value outliers.")
+        insights.append(f"The distribution of sales in {selected_region} is negatively skewed (skewness: {skewness:.2f}), indicating a concentration of higher sales with some lower-value outliers.")
     else:
-        st.write(f"The sales in {selected_region} are symmetrically distributed, with a skewness close to 0.")
+        insights.append(f"The sales in {selected_region} are symmetrically distributed, with a skewness close to 0.")
 
     # 3. Outliers Insights
-    if not outliers.empty:
-        st.write(f"There are **{len(outliers)} potential outliers** in the sales data for {selected_region}, suggesting a few games have sales far outside the normal range. These games either performed exceptionally well or poorly.")
+    if n_outliers:
+        insights.append(f"There are **{n_outliers} potential outliers** in the sales data for {selected_region}, suggesting a few games have sales far outside the normal range. These games either performed exceptionally well or poorly.")
     else:
-        st.write(f"No significant outliers detected in the sales data for {selected_region}, indicating the majority of the sales fall within the expected range.")
+        insights.append(f"No significant outliers detected in the sales data for {selected_region}, indicating the majority of the sales fall within the expected range.")
 
     # 4. Percentiles Insights
-    st.write(f"The interquartile range (IQR) for sales in {selected_region} is {IQR:.2f} million units. This shows the middle 50% of the games' sales are distributed across this range, giving an idea of the typical performance range for games.")
+    insights.append(f"The interquartile range (IQR) for sales in {selected_region} is {IQR:.2f} million units. This shows the middle 50% of the games' sales are distributed across this range, giving an idea of the typical performance range for games.")
+
+    # Render all insights as a single markdown element
+    write_paragraphs(insights)
+
+
+
+# Arrow copy of the dataset for the full table view, converted once instead of on every render
+@st.cache_resource
+def data_arrow_table():
+    return pa.Table.from_pandas(data)
 
+# Static text of the introduction, rendered as one markdown element
+INTRO_MD = """
+## Introduction
 
+The dataset provided contains information on video game sales across different regions (**North America, Europe, Japan, and other regions**), 
+as well as global sales figures. Each record in the dataset represents a video game, along with attributes such as the **platform**, **genre**, 
+**publisher**, **release year**, and corresponding **sales figures**. 
+
+The dataset's primary objective is to **track sales performance** and understand the **distribution and relationships** between sales data 
+across different regions. This Streamlit application presents a variety of visualizations to explore the sales data and trends.
+"""
 
 # Function to display introduction and dataset overview
+@st.fragment  # Widget changes inside a page rerun only that page's function, not the whole script
 def show_intro_and_overview():
     # Display the main title only in this section
     st.title("🎮 Video Game Sales")
@@ -139,24 +313,19 @@ def show_intro_and_overview():
         intro_col1, _ = st.columns([2, 1])  # 2:1 ratio to limit the width
         
         with intro_col1:
-            # Introduction section
-            st.header("Introduction")
-            st.write("""
-            The dataset provided contains information on video game sales across different regions (**North America, Europe, Japan, and other regions**), 
-            as well as global sales figures. Each record in the dataset represents a video game, along with attributes such as the **platform**, **genre**, 
-            **publisher**, **release year**, and corresponding **sales figures**. 
-
-            The dataset's primary objective is to **track sales performance** and understand the **distribution and relationships** between sales data 
-            across different regions. This Streamlit application presents a variety of visualizations to explore the sales data and trends.
-            """)
+            # Introduction section (heading and text in a single markdown element)
+            st.markdown(INTRO_MD)
     
     # Create two columns: one for the dataset and one for metrics
     col1, col2 = st.columns([2, 1])  # 3:1 ratio for dataset and metrics
     
     with col1:
-        # Display dataset overview (Show all rows in a scrollable format)
+        # Display dataset overview (the first rows, or all rows on request, in a scrollable format)
         st.subheader("Dataset Overview")
-        st.dataframe(data)  # Show all rows in a scrollable dataframe
+        if st.checkbox("Show full dataset"):
+            st.dataframe(data_arrow_table())  # Show all rows in a scrollable dataframe
+        else:
+            st.dataframe(data.head(500))  # Only the top 500 games are sent to the browser
         st.write("Dataset Source: [Video Game Sales Dataset](https://www.kaggle.com/datasets/sidtwr/videogames-sales-dataset?select=Video_Games_Sales_as_at_22_Dec_2016.csv&classId=09460dc7-d15d-4ba5-b6d3-785da7a59bae&assignmentId=67bb0923-5499-4710-92d1-a69d91fe07b2&submissionId=12339343-d9ce-f9bb-4a76-dc964765a9ff)")
     
     with col2:
@@ -171,50 +340,57 @@ def show_intro_and_overview():
         # Show metrics (descriptive statistics)
         show_metrics(region_selection)
 
+# Layout shared by every render of the Sales Over Time chart
+line_layout = dict(
+    xaxis=dict(title='Year', showgrid=False),  # Disable grid lines on the x-axis for cleaner look
+    yaxis=dict(title='Sales (in millions)', showgrid=True)  # Enable grid lines on the y-axis
+)
+
+# Figures only depend on the selected options, so each one is built once and reused;
+# st.plotly_chart only reads the figure, so every rerun and session can share the same object
+@st.cache_resource(show_spinner=False)
+def build_line_figure(selected_region):
+    # Create the line chart (WebGL instead of SVG) straight from the yearly totals
+    aggregated_data = tables.by_year
+    return go.Figure(
+        go.Scattergl(
+            x=aggregated_data['Year'].to_numpy(),
+            y=aggregated_data[region_mapping[selected_region]].to_numpy(),
+            mode='lines',
+            line_shape='linear',  # Ensures a smooth line plot
+            name=selected_region
+        ),
+        layout=dict(line_layout, title=dict(text=f"Sales Over Time for {selected_region}", x=0.5))  # Center the title
+    )
+
 # Function to display the Sales Over Time Line Chart
 
+@st.fragment
 def sales_over_time_chart():
     st.title("Sales Over Time")
     
     # Allow the user to select a region
     selected_region = st.selectbox("Select a region for sales over time:", list(region_mapping.keys()))
     
-    # Ensure the data has the release year and selected region's sales
-    if 'Year' not in data.columns or data['Year'].isnull().all():
+    # Ensure the data has the release year
+    if 'Year' not in data.columns:
         st.warning("No 'Year' data available in the dataset.")
         return
     
-    # Filter out rows where Year or Sales data is missing
-    filtered_data = data[['Year', region_mapping[selected_region]]].dropna()
-
-    # Convert 'Year' column to integer type to avoid plotting errors
-    filtered_data['Year'] = filtered_data['Year'].astype(int)
-
-    # Aggregate sales by year (sum up the sales for each year)
-    aggregated_data = filtered_data.groupby('Year').sum().reset_index()
-
-    # Create the line chart using Plotly
-    fig_line = px.line(
-        aggregated_data,
-        x='Year',
-        y=region_mapping[selected_region],
-        labels={'Year': 'Year', region_mapping[selected_region]: 'Sales (in millions)'},
-        title=f"Sales Over Time for {selected_region}",
-        line_shape='linear'  # Ensures a smooth line plot
-    )
+    # Sales aggregated by year (the sum of the sales for each year)
+    aggregated_data = tables.by_year
 
-    # Customize the chart layout for better appearance
-    fig_line.update_layout(
-        xaxis=dict(showgrid=False),  # Disable grid lines on the x-axis for cleaner look
-        yaxis=dict(showgrid=True),   # Enable grid lines on the y-axis
-        title_x=0.5  # Center the title
-    )
+    # Every game is missing its release year
+    if aggregated_data.empty:
+        st.warning("No 'Year' data available in the dataset.")
+        return
 
     # Display the line chart
-    st.plotly_chart(fig_line, use_container_width=True)
+    st.plotly_chart(build_line_figure(selected_region), use_container_width=True)
 
-    # Add a dynamic description based on sales trends
-    sales_trend = aggregated_data[region_mapping[selected_region]].diff().mean()
+    # Add a dynamic description based on sales trends (the yearly changes are taken in hundredths,
+    # the data's precision, where they are exact: unchanged totals give a trend of exactly 0)
+    sales_trend = (aggregated_data[region_mapping[selected_region]] * 100).round().diff().mean()
 
     # Dynamic trend description based on sales data
     if sales_trend > 0:
@@ -239,10 +415,38 @@ def sales_over_time_chart():
 
 
 
-# Data preparation for pie chart
-platform_sales = data.groupby('Platform')['Global_Sales'].sum().reset_index()
+# Custom color palette for the pie chart
+custom_colors = ('#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A',
+                 '#19D3F3', '#FF6692', '#B6E880', '#FF97FF', '#FECB52')
+
+# Layout shared by every render of the pie chart: colors, size and legend position
+pie_layout = dict(
+    piecolorway=custom_colors,  # Custom color sequence (plotly.js extends it with lighter and darker shades and assigns it by slice size)
+    width=700,  # Adjust the width of the pie chart
+    height=700,  # Adjust the height of the pie chart
+    legend=dict(title=dict(text='Platform'), orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5)  # Position the legend below the chart
+)
+
+# Pie chart of the platform sales for one sales column
+@st.cache_resource(show_spinner=False)
+def build_pie_figure(selected_sales_column):
+    region_sales = tables.by_platform[selected_sales_column]
+
+    # Create the pie chart with customizations
+    return go.Figure(
+        go.Pie(
+            labels=region_sales.index.to_numpy(),
+            values=region_sales.to_numpy(),
+            textposition='inside',
+            textinfo='percent+label',
+            hoverinfo='label+percent+value',
+            hole=0.4  # Makes it a donut chart (hole=0.4)
+        ),
+        layout=pie_layout
+    )
 
 # Customized Pie Chart Function (Sales by Region)
+@st.fragment
 def pie_chart():
     # Create a column layout with a limited width for the selectbox
     select_col, _ = st.columns([1, 3])  # 1:3 ratio to limit the width of the selectbox
@@ -254,45 +458,15 @@ def pie_chart():
             ["Global Sales", "NA Sales", "EU Sales", "JP Sales", "Other Sales"]
         )
 
-    # Mapping for the region to the actual column name in the dataset
-    region_mapping = {
-        "Global Sales": "Global_Sales",
-        "NA Sales": "NA_Sales",
-        "EU Sales": "EU_Sales",
-        "JP Sales": "JP_Sales",
-        "Other Sales": "Other_Sales"
-    }
-
     # Get the selected region's sales column
     selected_sales_column = region_mapping[region_selection]
 
-    # Group the data by Platform for the selected region's sales
-    region_sales = data.groupby('Platform')[selected_sales_column].sum().reset_index()
+    # Platform sales for the selected region
+    region_sales = tables.by_platform[selected_sales_column].reset_index()
 
     # Display the pie chart title using st.title (this replaces the main title)
     st.title(f"{region_selection} Distribution by Platform")
 
-    # Custom color palette (optional)
-    custom_colors = ['#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A', 
-                     '#19D3F3', '#FF6692', '#B6E880', '#FF97FF', '#FECB52']
-    
-    # Create the pie chart with customizations
-    fig_pie = px.pie(region_sales, names='Platform', values=selected_sales_column,
-                     color_discrete_sequence=custom_colors)  # Custom color sequence
-
-    # Customize the appearance
-    fig_pie.update_traces(textposition='inside', textinfo='percent+label', 
-                          hoverinfo='label+percent+value', 
-                          hole=0.4)  # Makes it a donut chart (hole=0.4)
-
-    # Customize the layout: title, legend position, size, etc.
-    fig_pie.update_layout(
-        width=700,  # Adjust the width of the pie chart
-        height=700,  # Adjust the height of the pie chart
-        legend_title_text='Platform',  # Legend title
-        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5)  # Position the legend below the chart
-    )
-
     # Find the platform with the highest and lowest sales for the selected region
     top_platform = region_sales.loc[region_sales[selected_sales_column].idxmax()]
     lowest_platform = region_sales.loc[region_sales[selected_sales_column].idxmin()]
@@ -302,7 +476,7 @@ def pie_chart():
     
     with col1:
         # Display the pie chart
-        st.plotly_chart(fig_pie, use_container_width=True)
+        st.plotly_chart(build_pie_figure(selected_sales_column), use_container_width=True)
     
     with col2:
         # Display a brief bullet-point description beside the pie chart
@@ -314,62 +488,76 @@ def pie_chart():
         - This chart highlights the clear dominance of **{top_platform['Platform']}**, showcasing its immense popularity in the {region_selection} region.
         """)
 
+# Layout shared by every render of the histogram
+histogram_layout = dict(
+    yaxis=dict(title="Frequency"),
+    bargap=0.2,
+    width=900,  # Fixed size, so the browser does not re-layout the chart to the container on each rerun
+    height=500
+)
+
+# Histogram of one region's sales
+@st.cache_resource(show_spinner=False)
+def build_histogram_figure(selected_region):
+    # The sales are binned at startup so only the bar heights are sent to the browser
+    counts, edges = tables.histograms[region_mapping[selected_region]]
+
+    # Create a histogram from the precomputed bins
+    return go.Figure(
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,  # Bin centers
+            y=counts,
+            name=f"{selected_region} Sales"
+        ),
+        layout=dict(
+            histogram_layout,
+            title=dict(text=f"{selected_region} Sales Distribution"),
+            xaxis=dict(title=f"{selected_region} Sales (in millions)")
+        )
+    )
+
 # Function for displaying a Histogram
+@st.fragment
 def histogram_chart():
     st.title("Sales Distribution (Histogram)")
 
     # Allow the user to select a region
     selected_region = st.selectbox("Select a region for the histogram:", list(region_mapping.keys()))
 
-    # Filter the relevant data for the selected region
-    sales_data = data[region_mapping[selected_region]].dropna()
-
-    # Create a histogram
-    fig_histogram = px.histogram(
-        sales_data,
-        nbins=30,  # Number of bins
-        labels={region_mapping[selected_region]: f"{selected_region} Sales"},
-        title=f"{selected_region} Sales Distribution",
-    )
-
-    # Customize the layout for the histogram
-    fig_histogram.update_layout(
-        xaxis_title=f"{selected_region} Sales (in millions)",
-        yaxis_title="Frequency",
-        bargap=0.2
-    )
-
     # Display the histogram
-    st.plotly_chart(fig_histogram, use_container_width=True)
+    st.plotly_chart(build_histogram_figure(selected_region), use_container_width=False)
+
+    # Look up key statistics for dynamic explanation
+    stats = region_stats[region_mapping[selected_region]]
+    mean_sales = stats["mean"]
+    median_sales = stats["median"]
+    std_sales = stats["std"]
+    skewness = stats["skew"]
 
-    # Calculate key statistics for dynamic explanation
-    mean_sales = sales_data.mean()
-    median_sales = sales_data.median()
-    std_sales = sales_data.std()
-    skewness = sales_data.skew()
+    insights = []  # Paragraphs collected below and rendered together
 
     # Mean and Median explanation
     if mean_sales > median_sales:
-        st.write(f"""
+        insights.append(f"""
         The sales distribution in {selected_region} is **positively skewed**. 
         The mean sales ({mean_sales:.2f} million units) is higher than the median sales ({median_sales:.2f} million units), 
         indicating that while most games sell at or below the median value, there are some games with very high sales, pulling the average up.
         """)
     elif mean_sales < median_sales:
-        st.write(f"""
+        insights.append(f"""
         The sales distribution in {selected_region} is **negatively skewed**. 
         The mean sales ({mean_sales:.2f} million units) is lower than the median sales ({median_sales:.2f} million units), 
         suggesting that most games in this region sell at or above the median value, but there are some games with very low sales that pull the average down.
         """)
     else:
-        st.write(f"""
+        insights.append(f"""
         The sales distribution in {selected_region} is **symmetrical**, with the mean sales ({mean_sales:.2f} million units) 
         and median sales ({median_sales:.2f} million units) being roughly the same. This indicates a balanced distribution of sales 
         around the average, where most games perform similarly.
         """)
 
     # Spread (Standard Deviation) explanation
-    st.write(f"""
+    insights.append(f"""
     The standard deviation of sales is {std_sales:.2f} million units, indicating that the spread of sales values is {'high' if std_sales > 1 else 'low'}. 
     A higher spread suggests that there is a significant variation in how different games perform in {selected_region}. 
     Conversely, a lower spread would indicate that most games have similar sales figures, reflecting a more uniform market.
@@ -377,21 +565,70 @@ def histogram_chart():
 
     # Skewness explanation
     if skewness > 0:
-        st.write(f"The distribution is **positively skewed** with a skewness of {skewness:.2f}, meaning that there are a few games with extremely high sales.")
+        insights.append(f"The distribution is **positively skewed** with a skewness of {skewness:.2f}, meaning that there are a few games with extremely high sales.")
     elif skewness < 0:
-        st.write(f"The distribution is **negatively skewed** with a skewness of {skewness:.2f}, meaning that there are a few games with very low sales compared to the rest.")
+        insights.append(f"The distribution is **negatively skewed** with a skewness of {skewness:.2f}, meaning that there are a few games with very low sales compared to the rest.")
     else:
-        st.write(f"The distribution has **no skew** with a skewness of {skewness:.2f}, indicating a relatively symmetrical distribution of sales.")
+        insights.append(f"The distribution has **no skew** with a skewness of {skewness:.2f}, indicating a relatively symmetrical distribution of sales.")
 
     # Final explanation based on the shape of the distribution
-    st.write(f"""
+    insights.append(f"""
     This histogram provides insights into how video games sell in {selected_region}. A positively skewed distribution with a high standard deviation 
     might suggest that a few top-performing games dominate the market, while most other games sell significantly less. 
     On the other hand, a lower standard deviation or a symmetrical distribution could indicate a more evenly distributed market where games perform consistently.
     """)
 
+    # Render all insights as a single markdown element
+    write_paragraphs(insights)
+
+
+# Layout shared by every render of the box plot
+box_layout = dict(
+    title=dict(text="Sales Comparison across Regions"),
+    showlegend=False,
+    xaxis=dict(title="Sales Region"),
+    yaxis=dict(title="Sales (in millions)"),
+    width=900,  # Fixed size like the histogram
+    height=500
+)
+
+# Box plot of the selected regions (a tuple, in selection order)
+@st.cache_resource(show_spinner=False)
+def build_box_figure(selected_regions):
+    # Only the precomputed summary of each selected region is sent to the browser, not every sale
+    selected_columns = [region_mapping[r] for r in selected_regions]
+    selected_stats = [region_stats[column] for column in selected_columns]
+
+    # Create the box plot from the quartiles and whiskers
+    box_color = "#636efa"  # Plotly's default trace color
+    fig_box = go.Figure(
+        go.Box(
+            x=selected_columns,
+            q1=[stats["quartiles"][0] for stats in selected_stats],
+            median=[stats["median"] for stats in selected_stats],
+            q3=[stats["quartiles"][2] for stats in selected_stats],
+            lowerfence=[stats["lower_fence"] for stats in selected_stats],
+            upperfence=[stats["upper_fence"] for stats in selected_stats],
+            marker_color=box_color
+        ),
+        layout=box_layout
+    )
+
+    # Outliers beyond the whiskers, one point per distinct value
+    # (SVG like the box itself, so the figure is not split between an SVG and a WebGL layer)
+    outliers = [stats["outliers"] for stats in selected_stats]
+    fig_box.add_trace(
+        go.Scatter(
+            x=np.repeat(selected_columns, [values.size for values in outliers]),
+            y=np.concatenate(outliers) if outliers else np.empty(0),
+            mode="markers",
+            marker=dict(color=box_color, size=4)
+        )
+    )
+    return fig_box
 
 # Function for displaying a Box Plot
+@st.fragment
 def box_plot_chart():
     st.title("Sales Comparison (Box Plot)")
 
@@ -402,38 +639,26 @@ def box_plot_chart():
         default=["Global Sales", "NA Sales", "EU Sales"]  # Default selections
     )
 
-    # Prepare the data for box plot by melting the DataFrame
-    box_data = data[["Global_Sales", "NA_Sales", "EU_Sales", "JP_Sales", "Other_Sales"]].dropna()
-    melted_data = pd.melt(box_data, var_name="Region", value_name="Sales")
-
-    # Create the box plot
-    fig_box = px.box(
-        melted_data[melted_data["Region"].isin([region_mapping[r] for r in selected_regions])],
-        x="Region",
-        y="Sales",
-        title="Sales Comparison across Regions",
-        labels={"Region": "Sales Region", "Sales": "Sales (in millions)"}
-    )
-
     # Display the box plot
-    st.plotly_chart(fig_box, use_container_width=True)
+    st.plotly_chart(build_box_figure(tuple(selected_regions)), use_container_width=False)
 
     # Dynamic description of the box plot
     st.subheader("Insights into Sales Comparison")
 
+    insights = []  # Paragraphs collected below and rendered together
+
     # Loop over the selected regions to give insights for each one
     for region in selected_regions:
-        region_sales = data[region_mapping[region]].dropna()
-        median_sales = region_sales.median()
-        iqr_sales = region_sales.quantile(0.75) - region_sales.quantile(0.25)  # Interquartile range
-        min_sales = region_sales.min()
-        max_sales = region_sales.max()
-        outliers = len(region_sales[(region_sales < (region_sales.quantile(0.25) - 1.5 * iqr_sales)) | 
-                                    (region_sales > (region_sales.quantile(0.75) + 1.5 * iqr_sales))])
+        stats = region_stats[region_mapping[region]]
+        median_sales = stats["median"]
+        iqr_sales = stats["iqr"]  # Interquartile range
+        min_sales = stats["min"]
+        max_sales = stats["max"]
+        outliers = stats["n_outliers"]
 
         # Dynamic explanation for each region
-        st.write(f"### {region} Sales Insights")
-        st.write(f"""
+        insights.append(f"### {region} Sales Insights")
+        insights.append(f"""
         The median sales for {region} is **{median_sales:.2f} million units**, indicating that half of the games sold more than this amount, 
         while the other half sold less. The **interquartile range (IQR)**, which represents the middle 50% of sales, is **{iqr_sales:.2f} million units**, 
         suggesting that the sales data for most games are concentrated within this range.
@@ -441,42 +666,78 @@ def box_plot_chart():
 
         # Outliers explanation
         if outliers > 0:
-            st.write(f"""
+            insights.append(f"""
             There are **{outliers} outliers** in the {region} sales data. These are games that either significantly underperformed or overperformed 
             compared to the rest of the market. Outliers can be seen as points that fall outside the whiskers of the box plot, and their presence 
             suggests that a few games stand out with either very low or very high sales in this region.
             """)
         else:
-            st.write(f"There are no significant outliers in the {region} sales data, indicating a relatively consistent distribution of sales across games.")
+            insights.append(f"There are no significant outliers in the {region} sales data, indicating a relatively consistent distribution of sales across games.")
 
         # Spread explanation
         if iqr_sales > 1:
-            st.write(f"""
+            insights.append(f"""
             The spread of sales in {region} is quite **wide**, with an interquartile range of {iqr_sales:.2f} million units. This suggests that 
             games in this region have varied performance, with some selling significantly better than others.
             """)
         else:
-            st.write(f"""
+            insights.append(f"""
             The spread of sales in {region} is relatively **narrow**, with an interquartile range of {iqr_sales:.2f} million units. 
             This indicates that most games in {region} tend to perform similarly, with fewer extremes in sales.
             """)
 
         # Range explanation
-        st.write(f"""
+        insights.append(f"""
         The sales range in {region} extends from a minimum of {min_sales:.2f} million units to a maximum of {max_sales:.2f} million units, 
         showing the complete variation in game sales within this region.
         """)
 
     # Final comparison explanation
-    st.write(f"""
+    insights.append(f"""
     The box plot allows you to compare how video games perform in different regions based on their sales distribution. The relative height 
     of each box reflects the range of sales for the region, while the median line inside each box shows where the midpoint of sales lies. 
     Outliers, represented as individual points outside the whiskers, can help identify exceptional cases—either bestsellers or poor performers.
     """)
 
+    # Render all insights as a single markdown element
+    write_paragraphs(insights)
+
+
+
+# Scatter plot of two regions with their OLS trendline
+@st.cache_resource(show_spinner=False)
+def build_scatter_figure(region_x, region_y):
+    # Games with identical sales pairs are drawn on top of each other, so only the distinct points are sent to the browser
+    plot_data = data[[region_mapping[region_x], region_mapping[region_y]]].drop_duplicates()
+
+    # Create a scatter plot comparing the selected regions (points drawn with WebGL instead of SVG)
+    fig_scatter = go.Figure(
+        go.Scattergl(
+            x=plot_data[region_mapping[region_x]].to_numpy(),
+            y=plot_data[region_mapping[region_y]].to_numpy(),
+            mode="markers",
+            name="Games",
+            showlegend=False
+        ),
+        layout=dict(
+            title=dict(text=f"Scatter Plot: {region_x} vs {region_y}"),
+            xaxis=dict(title=region_x),
+            yaxis=dict(title=region_y)
+        )
+    )
 
+    # Add an OLS trendline for better comparison (fitted on every game, not only the plotted points)
+    x_idx = region_idx[region_x]
+    y_idx = region_idx[region_y]
+    x_stats = region_stats[region_mapping[region_x]]
+    trend_x = np.array([x_stats["min"], x_stats["max"]])
+    trend_y = tables.slopes[x_idx, y_idx] * trend_x + tables.intercepts[x_idx, y_idx]
+    # WebGL as well, so the figure is not split between an SVG and a WebGL layer
+    fig_scatter.add_trace(go.Scattergl(x=trend_x, y=trend_y, mode="lines", name="OLS trendline", showlegend=False))
+    return fig_scatter
 
 # Customized Scatter Chart Function for Region Comparison
+@st.fragment
 def scatter_chart():
     st.title("Compare Two Regions")
     
@@ -487,25 +748,11 @@ def scatter_chart():
     remaining_regions = [region for region in region_mapping.keys() if region != region_x]
     region_y = st.selectbox("Select Y-axis Region:", remaining_regions)
 
-    # Get the corresponding sales data for the selected regions
-    x_data = data[region_mapping[region_x]]
-    y_data = data[region_mapping[region_y]]
-
-    # Create a scatter plot comparing the selected regions
-    fig_scatter = px.scatter(
-        data,
-        x=x_data,
-        y=y_data,
-        labels={region_mapping[region_x]: region_x, region_mapping[region_y]: region_y},
-        title=f"Scatter Plot: {region_x} vs {region_y}",
-        trendline="ols"  # Add a trendline for better comparison
-    )
-
-    # Calculate the correlation between the two selected regions
-    correlation, _ = pearsonr(x_data, y_data)
+    # Look up the correlation between the two selected regions
+    correlation = tables.correlation[region_idx[region_x], region_idx[region_y]]
 
     # Display the scatter chart
-    st.plotly_chart(fig_scatter, use_container_width=True)
+    st.plotly_chart(build_scatter_figure(region_x, region_y), use_container_width=True)
 
     # Add a detailed dynamic description based on the correlation
     if correlation > 0.75:
@@ -546,6 +793,30 @@ def scatter_chart():
 
 
 
+# Layout shared by every render of the genre chart
+genre_layout = dict(
+    barmode='stack',
+    xaxis=dict(title="Genre"),
+    yaxis=dict(title="Sales (in millions)"),
+    legend=dict(title=dict(text="Region")),
+    width=800,
+    height=600
+)
+
+# Stacked bar chart of the regional sales of every genre (no options, so it is built once)
+@st.cache_resource(show_spinner=False)
+def build_genre_figure():
+    # Filter the relevant columns (Genre and regional sales)
+    sales_columns = ["NA_Sales", "EU_Sales", "JP_Sales", "Other_Sales"]
+    genre_sales = tables.by_genre[sales_columns]
+    genres = genre_sales.index.to_numpy()
+
+    # Create the stacked bar chart (one bar trace per region)
+    return go.Figure(
+        [go.Bar(x=genres, y=genre_sales[column].to_numpy(), name=column) for column in sales_columns],
+        layout=genre_layout
+    )
+
 # Function to display the Regional Sales Breakdown by Genre (Stacked Bar Chart)
 def regional_sales_by_genre_chart():
     st.title("Regional Sales Breakdown by Genre")
@@ -558,89 +829,61 @@ def regional_sales_by_genre_chart():
     total sales for the genre, while the color segments show the sales distribution across regions.
     """)
 
-    # Filter the relevant columns (Genre and regional sales)
-    sales_columns = ["NA_Sales", "EU_Sales", "JP_Sales", "Other_Sales"]
-    genre_sales = data.groupby('Genre')[sales_columns].sum().reset_index()
-
-    # Melt the dataframe to have one column for sales regions and values for easier plotting
-    melted_genre_sales = pd.melt(genre_sales, id_vars='Genre', value_vars=sales_columns, 
-                                 var_name='Region', value_name='Sales')
-
-    # Create the stacked bar chart
-    fig_bar = px.bar(melted_genre_sales, 
-                     x='Genre', 
-                     y='Sales', 
-                     color='Region', 
-                     labels={'Sales': 'Sales (in millions)', 'Genre': 'Genre'},
-                     barmode='stack')
-
-    # Customize layout for better presentation
-    fig_bar.update_layout(
-        xaxis_title="Genre",
-        yaxis_title="Sales (in millions)",
-        legend_title="Region",
-        width=800, 
-        height=600
-    )
-
     # Display the chart
-    st.plotly_chart(fig_bar, use_container_width=True)
+    st.plotly_chart(build_genre_figure(), use_container_width=True)
 
 
-# Function to display general insights and takeaways in the Conclusion tab
-def show_conclusion():
-    st.title("Conclusion: Key Insights and Takeaways")
-    
-    st.subheader("General Sales Trends Across Regions")
-    st.write("""
-    - **Global Sales**: Video games tend to perform differently across regions, with some regions like **North America** and **Europe** showing stronger sales trends compared to regions like **Japan**.
-    - **Platform Dominance**: Specific platforms such as the **Nintendo DS** and **PlayStation** have consistently performed well across multiple regions, while other platforms like the **Xbox** have seen more regional popularity.
-    - **Genre Popularity**: Certain genres, such as **Action** and **Sports**, dominate global sales, but niche genres like **Role-Playing** tend to have strong followings in regions like Japan.
-    """)
+# Static text of the Conclusion tab (title, sections and text in a single markdown element)
+CONCLUSION_MD = """
+# Conclusion: Key Insights and Takeaways
 
-    st.subheader("Key Takeaways from Data Analysis")
-    st.write("""
-    - **Skewness in Sales**: The sales distributions across most regions tend to be **positively skewed**, indicating that while a majority of games sell below the median, a few blockbuster titles push the average sales higher.
-    - **Outliers**: There are many **outliers** in the sales data, particularly for best-selling games, which have significantly outperformed the rest of the market.
-    - **Region-Specific Preferences**: Each region exhibits unique preferences, with games performing well in one region not necessarily achieving similar success in another. For instance, **Role-Playing Games (RPGs)** are more popular in **Japan**, while **Sports** and **Action** games lead the charts in **North America**.
-    """)
+### General Sales Trends Across Regions
 
-    st.subheader("Market Insights for Stakeholders")
-    st.write("""
-    - **Developers and Publishers**: Understanding these sales patterns is crucial for developers and publishers when considering game localization, marketing strategies, and which genres to focus on in different regions.
-    - **Platform Holders**: Platform dominance varies by region, so platform holders like **Nintendo**, **Sony**, and **Microsoft** can use these insights to tailor their game offerings and expand their market share in underperforming regions.
-    - **Investors**: Investors can use this data to identify growing trends in specific regions or genres, investing in studios or platforms that align with the strongest growth areas.
-    """)
+- **Global Sales**: Video games tend to perform differently across regions, with some regions like **North America** and **Europe** showing stronger sales trends compared to regions like **Japan**.
+- **Platform Dominance**: Specific platforms such as the **Nintendo DS** and **PlayStation** have consistently performed well across multiple regions, while other platforms like the **Xbox** have seen more regional popularity.
+- **Genre Popularity**: Certain genres, such as **Action** and **Sports**, dominate global sales, but niche genres like **Role-Playing** tend to have strong followings in regions like Japan.
 
-    st.subheader("Future Trends to Watch")
-    st.write("""
-    - The growing popularity of **digital distribution** and **subscription-based gaming services** may significantly impact future sales trends.
-    - Regional preferences could shift as cloud gaming becomes more prevalent, reducing barriers to access for certain platforms.
-    - The rise of **mobile gaming** and **cross-platform play** may also lead to new sales trends across different regions and platforms.
-    """)
+### Key Takeaways from Data Analysis
 
-    st.subheader("Conclusion")
-    st.write("""
-    Overall, the data provides valuable insights into the global video game market, with clear regional trends and market dynamics. 
-    By understanding the key takeaways from this analysis, industry stakeholders can make more informed decisions on game development, 
-    distribution, and marketing strategies to maximize their success across different markets.
-    """)
+- **Skewness in Sales**: The sales distributions across most regions tend to be **positively skewed**, indicating that while a majority of games sell below the median, a few blockbuster titles push the average sales higher.
+- **Outliers**: There are many **outliers** in the sales data, particularly for best-selling games, which have significantly outperformed the rest of the market.
+- **Region-Specific Preferences**: Each region exhibits unique preferences, with games performing well in one region not necessarily achieving similar success in another. For instance, **Role-Playing Games (RPGs)** are more popular in **Japan**, while **Sports** and **Action** games lead the charts in **North America**.
+
+### Market Insights for Stakeholders
+
+- **Developers and Publishers**: Understanding these sales patterns is crucial for developers and publishers when considering game localization, marketing strategies, and which genres to focus on in different regions.
+- **Platform Holders**: Platform dominance varies by region, so platform holders like **Nintendo**, **Sony**, and **Microsoft** can use these insights to tailor their game offerings and expand their market share in underperforming regions.
+- **Investors**: Investors can use this data to identify growing trends in specific regions or genres, investing in studios or platforms that align with the strongest growth areas.
+
+### Future Trends to Watch
+
+- The growing popularity of **digital distribution** and **subscription-based gaming services** may significantly impact future sales trends.
+- Regional preferences could shift as cloud gaming becomes more prevalent, reducing barriers to access for certain platforms.
+- The rise of **mobile gaming** and **cross-platform play** may also lead to new sales trends across different regions and platforms.
 
+### Conclusion
+
+Overall, the data provides valuable insights into the global video game market, with clear regional trends and market dynamics. 
+By understanding the key takeaways from this analysis, industry stakeholders can make more informed decisions on game development, 
+distribution, and marketing strategies to maximize their success across different markets.
+"""
+
+# Function to display general insights and takeaways in the Conclusion tab
+def show_conclusion():
+    st.markdown(CONCLUSION_MD)
+
+
+# Display logic for the app: the function that renders each menu option
+pages = {
+    "Introduction & Statistics": show_intro_and_overview,
+    "Sales by Platform": pie_chart,
+    "Sales Comparison": scatter_chart,
+    "Sales Over Time": sales_over_time_chart,
+    "Histogram": histogram_chart,
+    "Box Plot": box_plot_chart,
+    "Sales by Genre": regional_sales_by_genre_chart,
+    "Conclusion": show_conclusion
+}
 
-# Display logic for the app based on option selected
-if selected == "Introduction & Statistics":
-    show_intro_and_overview()
-elif selected == "Sales by Platform":
-    pie_chart()
-elif selected == "Sales Comparison":
-    scatter_chart()
-elif selected == "Sales Over Time":
-    sales_over_time_chart()
-elif selected == "Histogram":
-    histogram_chart()
-elif selected == "Box Plot":
-    box_plot_chart()
-elif selected == "Sales by Genre":
-    regional_sales_by_genre_chart()
-elif selected == "Conclusion":
-    show_conclusion()
+# Render the selected page (the introduction if the menu returns nothing known)
+pages.get(selected, show_intro_and_overview)()
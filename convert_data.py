@@ -0,0 +1,23 @@
+import pandas as pd
+
+# Dtypes of the dataset: float32 sales, int32 ranks, nullable int16 years (games without a
+# release year are kept) and categorical Platform, Genre and Publisher columns
+# (Name stays a string: it is mostly unique, so a category would not save anything)
+dtypes = {
+    "Rank": "int32",
+    "Year": "Int16",
+    "Platform": "category",
+    "Genre": "category",
+    "Publisher": "category",
+    "NA_Sales": "float32",
+    "EU_Sales": "float32",
+    "JP_Sales": "float32",
+    "Other_Sales": "float32",
+    "Global_Sales": "float32"
+}
+
+# Write the typed Parquet copy of videogamesales.csv that app.py loads
+# (run "python convert_data.py" again whenever the CSV changes)
+if __name__ == "__main__":
+    data = pd.read_csv("videogamesales.csv", dtype=dtypes)
+    data.to_parquet("videogamesales.parquet", engine="pyarrow", index=False)